@@ -4,61 +4,87 @@ Extract inline SVGs from markdown files and save as separate files.
 Replace inline SVGs with image references.
 """
 
+import functools
 import re
 import os
+import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Pattern to match SVG blocks (including multiline)
+SVG_PATTERN = re.compile(r'<svg[^>]*>.*?</svg>', re.DOTALL)
+
+# XML declaration prepended to extracted SVGs, pre-encoded once
+XML_DECLARATION = b'<?xml version="1.0" encoding="UTF-8"?>\n'
+
+# Opening svg tag with a 4-part viewBox; the last two parts are the dimensions
+VIEWBOX_PATTERN = re.compile(r'<svg ([^>]*viewBox="\S+\s+\S+\s+(\S+)\s+(\S+)"[^>]*>)')
+
+def _inject_dimensions(match):
+    """Prepend width/height taken from the viewBox to the svg tag."""
+    width, height = match.group(2), match.group(3)
+    return f'<svg width="{width}" height="{height}" {match.group(1)}'
+
 def extract_svgs(markdown_file, images_dir):
     """Extract SVGs from a markdown file and save to images directory."""
     with open(markdown_file, 'r') as f:
         content = f.read()
 
-    # Pattern to match SVG blocks (including multiline)
-    svg_pattern = re.compile(r'<svg[^>]*>.*?</svg>', re.DOTALL)
-
-    # Find all SVGs
-    svgs = svg_pattern.findall(content)
-
-    if not svgs:
-        return content
-
     # Get base name for this chapter
     base_name = Path(markdown_file).stem
 
-    # Replace each SVG with an image reference
-    for i, svg in enumerate(svgs, 1):
+    # One forward pass over the match spans: the text between SVGs and
+    # each image reference are collected and joined at the end, so SVG
+    # bodies are written out without ever being gathered into a list.
+    out = []
+    last = 0
+    for i, match in enumerate(SVG_PATTERN.finditer(content), 1):
         # Create SVG filename
         svg_filename = f"{base_name}-fig{i:02d}.svg"
         svg_path = os.path.join(images_dir, svg_filename)
 
-        # Add XML declaration and fix viewBox for better rendering
-        svg_content = svg
-        if not svg_content.startswith('<?xml'):
-            svg_content = '<?xml version="1.0" encoding="UTF-8"?>\n' + svg_content
+        svg_content = match.group()
 
-        # Add width/height if only viewBox is specified (helps with rendering)
+        # Add width/height if only viewBox is specified (helps with rendering);
+        # one compiled pattern extracts the dimensions and rewrites the tag
         if 'viewBox=' in svg_content and 'width=' not in svg_content:
-            # Extract viewBox dimensions
-            viewbox_match = re.search(r'viewBox="([^"]+)"', svg_content)
-            if viewbox_match:
-                parts = viewbox_match.group(1).split()
-                if len(parts) == 4:
-                    width, height = parts[2], parts[3]
-                    svg_content = svg_content.replace('<svg ', f'<svg width="{width}" height="{height}" ', 1)
-
-        # Save SVG file
-        with open(svg_path, 'w') as f:
-            f.write(svg_content)
+            svg_content = VIEWBOX_PATTERN.sub(_inject_dimensions, svg_content, count=1)
+
+        # Save SVG file as raw bytes (no TextIOWrapper), prepending the
+        # XML declaration for better rendering
+        body = svg_content.encode('utf-8')
+        if not body.startswith(b'<?xml'):
+            body = XML_DECLARATION + body
+        Path(svg_path).write_bytes(body)
+
+        print(f"  Extracted: {svg_filename}")
 
         # Replace in content with image reference
         # Use relative path from markdown file location
-        img_tag = f'![Figure {i}](images/{svg_filename})'
-        content = content.replace(svg, img_tag, 1)
+        out.append(content[last:match.start()])
+        out.append(f'![Figure {i}](images/{svg_filename})')
+        last = match.end()
 
-        print(f"  Extracted: {svg_filename}")
+    if not out:
+        return content
+    out.append(content[last:])
+    return ''.join(out)
+
+def process_file(md_file, images_dir, processed_dir):
+    """Process one markdown file (runs in a worker process)."""
+    output_file = processed_dir / md_file.name
+    if md_file.name == 'STRUCTURE.md':
+        # Just copy structure file (kernel-level copy, no string round trip)
+        shutil.copyfile(md_file, output_file)
+        return
 
-    return content
+    print(f"Processing {md_file.name}...")
+    content = extract_svgs(md_file, images_dir)
+
+    # Save processed file
+    with open(output_file, 'w') as f:
+        f.write(content)
 
 def main():
     script_dir = Path(__file__).parent
@@ -69,25 +95,20 @@ def main():
     images_dir.mkdir(exist_ok=True)
     processed_dir.mkdir(exist_ok=True)
 
-    # Process all markdown files
-    for md_file in sorted(script_dir.glob('*.md')):
-        if md_file.name == 'STRUCTURE.md':
-            # Just copy structure file
-            content = md_file.read_text()
-        else:
-            print(f"Processing {md_file.name}...")
-            content = extract_svgs(md_file, images_dir)
-
-        # Save processed file
-        output_file = processed_dir / md_file.name
-        with open(output_file, 'w') as f:
-            f.write(content)
+    # Process all markdown files. Each chapter writes its own figures and
+    # output file, so the work fans out across one process per core; the
+    # compiled patterns are built once per worker at import. list() drains
+    # the map so worker exceptions propagate.
+    worker = functools.partial(
+        process_file, images_dir=images_dir, processed_dir=processed_dir)
+    with ProcessPoolExecutor() as pool:
+        list(pool.map(worker, sorted(script_dir.glob('*.md'))))
 
     # Copy other necessary files
     for file in ['metadata.yaml', 'unix-style.css']:
         src = script_dir / file
         if src.exists():
-            (processed_dir / file).write_text(src.read_text())
+            shutil.copyfile(src, processed_dir / file)
 
     # Copy images directory reference
     print(f"\nExtracted SVGs to: {images_dir}")
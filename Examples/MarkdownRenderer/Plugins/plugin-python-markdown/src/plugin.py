@@ -16,6 +16,38 @@ class MarkdownPlugin:
     pass
 
 
+# MARK: - Compiled patterns
+# Compiled once at import so hot-path calls skip the re module's cache lookup.
+
+_HEADERS = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+# Emphasis stays as three sequential passes: a fused single pass pairs a
+# list-marker '*' with the first star of '**' and never revisits replaced
+# text, so nested emphasis would be left unrendered.
+_BOLD_ITALIC = re.compile(r'\*\*\*(.+?)\*\*\*')
+_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC = re.compile(r'\*(.+?)\*')
+_LINK = re.compile(r'\[(.+?)\]\((.+?)\)')
+_IMG = re.compile(r'!\[(.+?)\]\((.+?)\)')
+_CODE_BLOCK = re.compile(r'```(\w*)\n(.*?)\n```', re.DOTALL)
+_INLINE_CODE = re.compile(r'`(.+?)`')
+_HR = re.compile(r'^---+$', re.MULTILINE)
+_UNORDERED_LIST = re.compile(r'^[\*\-]\s+(.+)$', re.MULTILINE)
+_ORDERED_LIST = re.compile(r'^\d+\.\s+(.+)$', re.MULTILINE)
+
+# strip_markdown stays as sequential passes: they cascade (removing a
+# header prefix exposes the list marker behind it for the next pass),
+# which a fused single-pass alternation cannot reproduce.
+_STRIP_HEADERS = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+_STRIP_EMPHASIS = re.compile(r'\*{1,3}(.+?)\*{1,3}')
+_STRIP_LINKS = re.compile(r'\[(.+?)\]\(.+?\)')
+_STRIP_IMAGES = re.compile(r'!\[.+?\]\(.+?\)')
+_STRIP_CODE_BLOCKS = re.compile(r'```.*?```', re.DOTALL)
+_STRIP_INLINE_CODE = re.compile(r'`(.+?)`')
+_STRIP_HR = re.compile(r'^---+$', re.MULTILINE)
+_STRIP_UL_MARKERS = re.compile(r'^[\*\-]\s+', re.MULTILINE)
+_STRIP_OL_MARKERS = re.compile(r'^\d+\.\s+', re.MULTILINE)
+
+
 # MARK: - Action handlers
 
 @action(
@@ -73,8 +105,8 @@ def handle_word_count(input: AROInput) -> Dict[str, Any]:
     plain_text = strip_markdown(markdown)
     words = len(plain_text.split())
     chars = len(plain_text)
-    chars_no_spaces = len(plain_text.replace(" ", "").replace("\n", ""))
-    lines = len(markdown.split("\n"))
+    chars_no_spaces = chars - plain_text.count(" ") - plain_text.count("\n")
+    lines = markdown.count("\n") + 1
     return {
         "words": words,
         "characters": chars,
@@ -85,81 +117,102 @@ def handle_word_count(input: AROInput) -> Dict[str, Any]:
 
 # MARK: - Markdown Processing Functions
 
+def _wrap_paragraphs(html: str) -> str:
+    """Wrap non-tag lines in <p> elements."""
+    return '\n'.join(
+        f'<p>{stripped}</p>'
+        if (stripped := line.strip()) and not stripped.startswith('<')
+        else stripped
+        for line in html.split('\n')
+    )
+
+
+# Every substitution in markdown_to_html needs at least one of these
+# characters ('.' is for ordered lists), so their absence means only
+# paragraph wrapping can apply.
+_MD_METACHARS = '#*`[-.'
+
+
 def markdown_to_html(markdown: str) -> str:
     """Convert Markdown to HTML (simple implementation)."""
+    # Fast path: plain text skips all the regex passes
+    if not any(c in markdown for c in _MD_METACHARS):
+        return _wrap_paragraphs(markdown)
+
     html = markdown
 
-    # Headers
-    html = re.sub(r'^######\s+(.+)$', r'<h6>\1</h6>', html, flags=re.MULTILINE)
-    html = re.sub(r'^#####\s+(.+)$', r'<h5>\1</h5>', html, flags=re.MULTILINE)
-    html = re.sub(r'^####\s+(.+)$', r'<h4>\1</h4>', html, flags=re.MULTILINE)
-    html = re.sub(r'^###\s+(.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-    html = re.sub(r'^##\s+(.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-    html = re.sub(r'^#\s+(.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
+    # Headers (one pass for h1-h6; the level is the number of '#')
+    html = _HEADERS.sub(
+        lambda m: f'<h{len(m.group(1))}>{m.group(2)}</h{len(m.group(1))}>', html)
 
     # Bold and italic
-    html = re.sub(r'\*\*\*(.+?)\*\*\*', r'<strong><em>\1</em></strong>', html)
-    html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-    html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
+    html = _BOLD_ITALIC.sub(r'<strong><em>\1</em></strong>', html)
+    html = _BOLD.sub(r'<strong>\1</strong>', html)
+    html = _ITALIC.sub(r'<em>\1</em>', html)
 
     # Links
-    html = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2">\1</a>', html)
+    html = _LINK.sub(r'<a href="\2">\1</a>', html)
 
     # Images
-    html = re.sub(r'!\[(.+?)\]\((.+?)\)', r'<img src="\2" alt="\1">', html)
+    html = _IMG.sub(r'<img src="\2" alt="\1">', html)
 
     # Code blocks
-    html = re.sub(r'```(\w*)\n(.*?)\n```', r'<pre><code class="\1">\2</code></pre>',
-                  html, flags=re.DOTALL)
+    html = _CODE_BLOCK.sub(r'<pre><code class="\1">\2</code></pre>', html)
 
     # Inline code
-    html = re.sub(r'`(.+?)`', r'<code>\1</code>', html)
+    html = _INLINE_CODE.sub(r'<code>\1</code>', html)
 
     # Horizontal rules
-    html = re.sub(r'^---+$', r'<hr>', html, flags=re.MULTILINE)
+    html = _HR.sub(r'<hr>', html)
 
     # Unordered lists
-    html = re.sub(r'^[\*\-]\s+(.+)$', r'<li>\1</li>', html, flags=re.MULTILINE)
+    html = _UNORDERED_LIST.sub(r'<li>\1</li>', html)
 
     # Ordered lists
-    html = re.sub(r'^\d+\.\s+(.+)$', r'<li>\1</li>', html, flags=re.MULTILINE)
+    html = _ORDERED_LIST.sub(r'<li>\1</li>', html)
 
     # Paragraphs (simple approach - wrap non-tag lines)
-    lines = html.split('\n')
-    processed = []
-    for line in lines:
-        line = line.strip()
-        if line and not line.startswith('<'):
-            processed.append(f'<p>{line}</p>')
-        else:
-            processed.append(line)
-    html = '\n'.join(processed)
-
-    return html
+    return _wrap_paragraphs(html)
 
 
 def extract_links(markdown: str) -> List[Dict[str, str]]:
     """Extract all links from Markdown text."""
-    pattern = r'\[(.+?)\]\((.+?)\)'
-    matches = re.findall(pattern, markdown)
-
-    links = []
-    for text, url in matches:
-        links.append({"text": text, "url": url})
-
-    return links
+    return [{"text": text, "url": url} for text, url in _LINK.findall(markdown)]
 
 
 def extract_headings(markdown: str) -> List[Dict[str, Any]]:
     """Extract all headings from Markdown text."""
-    pattern = r'^(#{1,6})\s+(.+)$'
-    matches = re.finditer(pattern, markdown, re.MULTILINE)
-
-    headings = []
-    for match in matches:
-        level = len(match.group(1))
-        text = match.group(2).strip()
-        headings.append({"level": level, "text": text})
+    # Heading lines are rare compared to total text, so jump between
+    # line-initial '#' candidates with str.find (a C-level scan) instead
+    # of running the regex engine over every character. A candidate is a
+    # heading when 1-6 '#' are followed by an ASCII space or tab and at
+    # least one more character before the end of the line.
+    headings: List[Dict[str, Any]] = []
+    length = len(markdown)
+
+    if markdown.startswith('#'):
+        pos = 0
+    else:
+        found = markdown.find('\n#')
+        pos = found + 1 if found >= 0 else -1
+    while pos >= 0:
+        text_start = pos
+        while text_start < length and markdown[text_start] == '#':
+            text_start += 1
+        level = text_start - pos
+
+        line_end = markdown.find('\n', text_start)
+        if line_end < 0:
+            line_end = length
+
+        if level <= 6 and line_end - text_start >= 2 and markdown[text_start] in ' \t':
+            headings.append({
+                "level": level,
+                "text": markdown[text_start:line_end].strip(),
+            })
+
+        found = markdown.find('\n#', line_end)
+        pos = found + 1 if found >= 0 else -1
 
     return headings
 
@@ -169,29 +222,29 @@ def strip_markdown(markdown: str) -> str:
     text = markdown
 
     # Remove headers
-    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+    text = _STRIP_HEADERS.sub('', text)
 
     # Remove bold/italic
-    text = re.sub(r'\*{1,3}(.+?)\*{1,3}', r'\1', text)
+    text = _STRIP_EMPHASIS.sub(r'\1', text)
 
     # Remove links, keep text
-    text = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', text)
+    text = _STRIP_LINKS.sub(r'\1', text)
 
     # Remove images
-    text = re.sub(r'!\[.+?\]\(.+?\)', '', text)
+    text = _STRIP_IMAGES.sub('', text)
 
     # Remove code blocks
-    text = re.sub(r'```.*?```', '', text, flags=re.DOTALL)
+    text = _STRIP_CODE_BLOCKS.sub('', text)
 
     # Remove inline code
-    text = re.sub(r'`(.+?)`', r'\1', text)
+    text = _STRIP_INLINE_CODE.sub(r'\1', text)
 
     # Remove horizontal rules
-    text = re.sub(r'^---+$', '', text, flags=re.MULTILINE)
+    text = _STRIP_HR.sub('', text)
 
     # Remove list markers
-    text = re.sub(r'^[\*\-]\s+', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^\d+\.\s+', '', text, flags=re.MULTILINE)
+    text = _STRIP_UL_MARKERS.sub('', text)
+    text = _STRIP_OL_MARKERS.sub('', text)
 
     return text.strip()
 
@@ -5,7 +5,8 @@ This plugin provides collection qualifiers for ARO.
 Uses the ARO Plugin SDK decorator API.
 """
 
-from typing import Any, List
+import functools
+from typing import Any, Callable, List
 
 from aro_plugin_sdk import AROInput, export_abi, plugin, qualifier, run
 
@@ -15,13 +16,53 @@ class CollectionPlugin:
     pass
 
 
+def _requires_list(fn: Callable[[List[Any]], dict]) -> Callable[[AROInput], dict]:
+    """Unwrap the qualifier input and reject non-list values up front.
+
+    Every collection qualifier needs the same list check; doing it here
+    keeps the handlers focused on their actual operation. The wrapped
+    function receives the list directly.
+    """
+    name = fn.__name__.removeprefix("qualifier_")
+    error = {"error": f"{name} requires a list"}  # built once at import
+
+    @functools.wraps(fn)
+    def wrapper(input: AROInput) -> dict:
+        value = input.get("value")
+        if not isinstance(value, list):
+            return error
+        return fn(value)
+
+    return wrapper
+
+
+def _natively_orderable(value: List[Any]) -> bool:
+    """True when native comparison cannot raise: all numbers or all strings.
+
+    Checked up front so the happy path skips try/except setup. Inputs
+    that fail the check (e.g. nested lists) still get a native
+    comparison attempt, since it preserves element-wise ordering; only
+    a TypeError falls back to string keys. Both all() scans
+    short-circuit on the first mismatch.
+    """
+    return (all(isinstance(v, (int, float)) for v in value)
+            or all(isinstance(v, str) for v in value))
+
+
+# Static error payloads, built once at import instead of per bad call.
+_ERR_SUM_NOT_NUMERIC = {"error": "sum requires numeric list elements"}
+_ERR_AVG_NOT_NUMERIC = {"error": "avg requires numeric list elements"}
+_ERR_MIN_EMPTY = {"error": "min requires a non-empty list"}
+_ERR_MAX_EMPTY = {"error": "max requires a non-empty list"}
+
+
 # MARK: - Qualifier handlers
 
 @qualifier(name="sort", description="Sorts a list in ascending order")
-def qualifier_sort(input: AROInput) -> dict:
-    value = input.get("value")
-    if not isinstance(value, list):
-        return {"error": "sort requires a list"}
+@_requires_list
+def qualifier_sort(value: List[Any]) -> dict:
+    if _natively_orderable(value):
+        return {"result": sorted(value)}
     try:
         sorted_list = sorted(value)
     except TypeError:
@@ -30,10 +71,14 @@ def qualifier_sort(input: AROInput) -> dict:
 
 
 @qualifier(name="unique", description="Returns unique elements from a list")
-def qualifier_unique(input: AROInput) -> dict:
-    value = input.get("value")
-    if not isinstance(value, list):
-        return {"error": "unique requires a list"}
+@_requires_list
+def qualifier_unique(value: List[Any]) -> dict:
+    try:
+        # Fast path: one C-level pass, insertion order preserved.
+        return {"result": list(dict.fromkeys(value))}
+    except TypeError:
+        pass
+    # Unhashable (list) elements: dedupe via tuple keys.
     seen: set = set()
     unique_list: List[Any] = []
     for item in value:
@@ -45,38 +90,43 @@ def qualifier_unique(input: AROInput) -> dict:
 
 
 @qualifier(name="sum", description="Returns the sum of numeric list elements")
-def qualifier_sum(input: AROInput) -> dict:
-    value = input.get("value")
-    if not isinstance(value, list):
-        return {"error": "sum requires a list"}
-    numeric_values = [v for v in value if isinstance(v, (int, float))]
-    if not numeric_values:
-        return {"error": "sum requires numeric list elements"}
-    total = sum(numeric_values)
-    if all(isinstance(v, int) for v in numeric_values) and total == int(total):
-        total = int(total)
+@_requires_list
+def qualifier_sum(value: List[Any]) -> dict:
+    # Single pass: accumulate and count together instead of filtering
+    # into a list and summing it separately. Starting from int 0, the
+    # total stays int for all-int input and widens on the first float.
+    total: Any = 0
+    count = 0
+    for v in value:
+        if isinstance(v, (int, float)):
+            total += v
+            count += 1
+    if count == 0:
+        return _ERR_SUM_NOT_NUMERIC
     return {"result": total}
 
 
 @qualifier(name="avg", description="Returns the average of numeric list elements")
-def qualifier_avg(input: AROInput) -> dict:
-    value = input.get("value")
-    if not isinstance(value, list):
-        return {"error": "avg requires a list"}
-    numeric_values = [v for v in value if isinstance(v, (int, float))]
-    if not numeric_values:
-        return {"error": "avg requires numeric list elements"}
-    average = sum(numeric_values) / len(numeric_values)
-    return {"result": average}
+@_requires_list
+def qualifier_avg(value: List[Any]) -> dict:
+    total = 0
+    count = 0
+    for v in value:
+        if isinstance(v, (int, float)):
+            total += v
+            count += 1
+    if count == 0:
+        return _ERR_AVG_NOT_NUMERIC
+    return {"result": total / count}
 
 
 @qualifier(name="min", description="Returns the minimum element")
-def qualifier_min(input: AROInput) -> dict:
-    value = input.get("value")
-    if not isinstance(value, list):
-        return {"error": "min requires a list"}
+@_requires_list
+def qualifier_min(value: List[Any]) -> dict:
     if not value:
-        return {"error": "min requires a non-empty list"}
+        return _ERR_MIN_EMPTY
+    if _natively_orderable(value):
+        return {"result": min(value)}
     try:
         minimum = min(value)
     except TypeError:
@@ -85,12 +135,12 @@ def qualifier_min(input: AROInput) -> dict:
 
 
 @qualifier(name="max", description="Returns the maximum element")
-def qualifier_max(input: AROInput) -> dict:
-    value = input.get("value")
-    if not isinstance(value, list):
-        return {"error": "max requires a list"}
+@_requires_list
+def qualifier_max(value: List[Any]) -> dict:
     if not value:
-        return {"error": "max requires a non-empty list"}
+        return _ERR_MAX_EMPTY
+    if _natively_orderable(value):
+        return {"result": max(value)}
     try:
         maximum = max(value)
     except TypeError: